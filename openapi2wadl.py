@@ -12,8 +12,15 @@ import sys
 import json
 import enum
 import argparse
+import functools
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from types import MappingProxyType
+
+# parser json veloce opzionale (in sua assenza si usa il modulo json standard)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ####################################################################################################
 # Definizione costanti e namespace
@@ -55,33 +62,140 @@ ET.register_namespace(SOAP_PREFIX, SOAP_NAMESPACE)
 ET.register_namespace(TARGET_PREFIX, TARGET_NAMESPACE)
 
 # ####################################################################################################
-# Migliorare leggibilità xml
+# Definizione tag qualificati (precalcolati in notazione Clark)
 # ####################################################################################################
-def prettify_xml(elem):
 
-    rough_string = ET.tostring(elem, 'utf-8')
-    reparsed = minidom.parseString(rough_string)
-    pretty = reparsed.toprettyxml(indent="   ")
+XSD_COMPLEX_TYPE = f"{{{XSD_NAMESPACE}}}complexType"
+XSD_ELEMENT = f"{{{XSD_NAMESPACE}}}element"
+XSD_ENUMERATION = f"{{{XSD_NAMESPACE}}}enumeration"
+XSD_INCLUDE = f"{{{XSD_NAMESPACE}}}include"
+XSD_LENGTH = f"{{{XSD_NAMESPACE}}}length"
+XSD_MAX_EXCLUSIVE = f"{{{XSD_NAMESPACE}}}maxExclusive"
+XSD_MAX_INCLUSIVE = f"{{{XSD_NAMESPACE}}}maxInclusive"
+XSD_MAX_LENGTH = f"{{{XSD_NAMESPACE}}}maxLength"
+XSD_MIN_EXCLUSIVE = f"{{{XSD_NAMESPACE}}}minExclusive"
+XSD_MIN_INCLUSIVE = f"{{{XSD_NAMESPACE}}}minInclusive"
+XSD_MIN_LENGTH = f"{{{XSD_NAMESPACE}}}minLength"
+XSD_PATTERN = f"{{{XSD_NAMESPACE}}}pattern"
+XSD_RESTRICTION = f"{{{XSD_NAMESPACE}}}restriction"
+XSD_SCHEMA = f"{{{XSD_NAMESPACE}}}schema"
+XSD_SEQUENCE = f"{{{XSD_NAMESPACE}}}sequence"
+XSD_SIMPLE_TYPE = f"{{{XSD_NAMESPACE}}}simpleType"
+XSD_UNION = f"{{{XSD_NAMESPACE}}}union"
+
+WADL_APPLICATION = f"{{{WADL_NAMESPACE}}}application"
+WADL_GRAMMARS = f"{{{WADL_NAMESPACE}}}grammars"
+WADL_INCLUDE = f"{{{WADL_NAMESPACE}}}include"
+WADL_METHOD = f"{{{WADL_NAMESPACE}}}method"
+WADL_PARAM = f"{{{WADL_NAMESPACE}}}param"
+WADL_REPRESENTATION = f"{{{WADL_NAMESPACE}}}representation"
+WADL_REQUEST = f"{{{WADL_NAMESPACE}}}request"
+WADL_RESOURCE = f"{{{WADL_NAMESPACE}}}resource"
+WADL_RESOURCES = f"{{{WADL_NAMESPACE}}}resources"
+WADL_RESPONSE = f"{{{WADL_NAMESPACE}}}response"
+
+WSDL_BINDING = f"{{{WSDL_NAMESPACE}}}binding"
+WSDL_DEFINITIONS = f"{{{WSDL_NAMESPACE}}}definitions"
+WSDL_INPUT = f"{{{WSDL_NAMESPACE}}}input"
+WSDL_MESSAGE = f"{{{WSDL_NAMESPACE}}}message"
+WSDL_OPERATION = f"{{{WSDL_NAMESPACE}}}operation"
+WSDL_OUTPUT = f"{{{WSDL_NAMESPACE}}}output"
+WSDL_PART = f"{{{WSDL_NAMESPACE}}}part"
+WSDL_PORT = f"{{{WSDL_NAMESPACE}}}port"
+WSDL_PORT_TYPE = f"{{{WSDL_NAMESPACE}}}portType"
+WSDL_SERVICE = f"{{{WSDL_NAMESPACE}}}service"
+WSDL_TYPES = f"{{{WSDL_NAMESPACE}}}types"
+
+SOAP_ADDRESS = f"{{{SOAP_NAMESPACE}}}address"
+SOAP_BINDING = f"{{{SOAP_NAMESPACE}}}binding"
+SOAP_BODY = f"{{{SOAP_NAMESPACE}}}body"
+SOAP_HEADER = f"{{{SOAP_NAMESPACE}}}header"
+SOAP_OPERATION = f"{{{SOAP_NAMESPACE}}}operation"
+
+SOA_WSDL_OPERATION = f"{{{SOA_NAMESPACE}}}wsdlOperation"
+
+RESTRICTION_TAGS = (
+    ("pattern", XSD_PATTERN, None, None),
+    ("minLength", XSD_MIN_LENGTH, None, None),
+    ("maxLength", XSD_MAX_LENGTH, None, None),
+    ("minimum", XSD_MIN_INCLUSIVE, "exclusiveMinimum", XSD_MIN_EXCLUSIVE),
+    ("maximum", XSD_MAX_INCLUSIVE, "exclusiveMaximum", XSD_MAX_EXCLUSIVE)
+)
+
+# chiavi delle restrizioni gestite per tipi numerici e stringa
+NUMERIC_RESTRICTION_KEYS = frozenset(("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"))
+STRING_RESTRICTION_KEYS = frozenset(("minLength", "maxLength", "pattern", "enum"))
+STRING_LENGTH_KEYS = frozenset(("minLength", "maxLength"))
+
+# mappa le coppie tipo/formato swagger/openapi nei tipi atomici XSD (il formato None vale per ogni altro formato)
+ATOMIC_TYPES = {
+    ("boolean", None): "boolean",
+    ("string", "byte"): "base64Binary",
+    ("string", "date"): "date",
+    ("string", "date-time"): "dateTime",
+    ("string", None): "string",
+    ("number", ""): "decimal",
+    ("number", "float"): "float",
+    ("number", "double"): "double",
+    ("integer", ""): "integer",
+    ("integer", "int32"): "int",
+    ("integer", "int64"): "long"
+}
+
+# dizionario vuoto in sola lettura usato come default nelle letture dello schema (evita di allocarne uno ad ogni accesso)
+EMPTY_DICT = MappingProxyType({})
+
+# insiemi di chiavi dello schema gestite dal tipo mappato
+NO_KEYS = frozenset()
+NULLABLE_KEYS = frozenset(("nullable",))
+
+# mappa la posizione dei parametri swagger/openapi nello style WADL (le posizioni assenti non sono gestite come param)
+PARAM_STYLES = {"path": "template", "query": "query", "header": "header", "matrix": "matrix"}
+
+# dimensione del buffer di scrittura dei file xml generati
+WRITE_BUFFER_SIZE = 1 << 20
 
-    # Correggi solo gli attributi name con spazi interni
-    fixed = re.sub(r'name="([A-Za-z0-9_]+)(\s+)"', r'name="\1"\2', pretty)
+# ####################################################################################################
+# Indenta e scrive l'xml su file
+# ####################################################################################################
+def write_xml(elem, filename):
 
-    # Sposta in fondo minOccurs, maxOccurs, nillable sugli "element"
-    fixed = re.sub(r'<(.+?)(?=\snillable)(\snillable="[^"]*")([^\/|>]*)(\/)?>', r'<\1\3\2\4>', fixed)
-    fixed = re.sub(r'<(.+?)(?=\sminOccurs)(\sminOccurs="[^"]*")([^\/|>]*)(\/)?>', r'<\1\3\2\4>', fixed)
-    fixed = re.sub(r'<(.+?)(?=\smaxOccurs)(\smaxOccurs="[^"]*")([^\/|>]*)(\/)?>', r'<\1\3\2\4>', fixed)
+    # indenta l'albero in place
+    ET.indent(elem, space="   ")
 
     # compatta operations wsdl
-    fixed = re.sub(r'<wsdl:input>[^<>]*<soap:body use="literal"/>[^<>]*</wsdl:input>', r'<wsdl:input><soap:body use="literal"/></wsdl:input>',fixed,flags=re.DOTALL)
-    fixed = re.sub(r'<wsdl:output>[^<>]*<soap:body use="literal"/>[^<>]*</wsdl:output>', r'<wsdl:output><soap:body use="literal"/></wsdl:output>',fixed,flags=re.DOTALL)
-    
-    # Sposta in fondo id su "method"
-    fixed = re.sub(r'<(method)(\sid="[^"]*")([^\/|>]*)(\/)?>', r'<\1\3\2\4>', fixed)
+    for node in elem.iter():
+        if (node.tag in [WSDL_INPUT, WSDL_OUTPUT] and len(node) == 1 and
+            node[0].tag == SOAP_BODY and node[0].attrib == {"use": "literal"}):
+            node.text = None
+            node[0].tail = None
+
+    # serializza l'albero direttamente sul file in binario (già codificato utf-8), senza costruire in memoria la stringa dell'intero documento;
+    # il buffer da 1MB accorpa le numerose piccole scritture del serializzatore
+    with open(filename, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(b'<?xml version="1.0" ?>\n')
+        ET.ElementTree(elem).write(f, encoding="utf-8")
+        f.write(b"\n")
 
-    # Rimuove eventuali spazi finali dell'elemento
-    fixed = re.sub(r'"\s*>', r'">', fixed)
+# ####################################################################################################
+# Carica il file json (tramite orjson se disponibile)
+# ####################################################################################################
+def load_json(filename):
+
+    # legge il file in binario (i parser decodificano direttamente i bytes utf-8)
+    with open(filename, "rb") as f:
+        data = f.read()
 
-    return fixed
+    # orjson converte silenziosamente in float gli interi fuori dal range a 64 bit (es. limiti maximum molto grandi), quindi in presenza
+    # di sequenze di 19 o più cifre usa il modulo standard che li mantiene interi; ripiega sul modulo standard anche per i valori
+    # NaN/Infinity che orjson rifiuta
+    if orjson and not re.search(rb"\d{19,}", data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(data)
 
 # ####################################################################################################
 # Rileva la versione della specifica
@@ -127,6 +241,23 @@ def extract_root_schemas(spec, version):
     else:
         return spec.get("components", {}).get("schemas", {})
         
+# ####################################################################################################
+# Determina il nome del tipo referenziato da un $ref (ultimo token del path)
+# ####################################################################################################       
+@functools.lru_cache(maxsize=None)
+def ref_type_name(ref):
+
+    return ref.rpartition("/")[2]
+
+# ####################################################################################################
+# Determina il nome qualificato (con prefisso target) del tipo referenziato da un $ref
+# ####################################################################################################       
+@functools.lru_cache(maxsize=None)
+def ref_qualified_name(ref):
+
+    # la cache restituisce la stessa stringa per tutti gli attributi che referenziano il medesimo tipo
+    return f"{TARGET_PREFIX}:{ref_type_name(ref)}"
+
 # ####################################################################################################
 # Risolve i $ref dei parametri
 # ####################################################################################################       
@@ -134,7 +265,7 @@ def resolve_ref_responses(response, root_responses):
 
     # se è un $ref esegue
     if "$ref" in response:    
-        type_name = response.get("$ref").split("/")[-1]
+        type_name = ref_type_name(response.get("$ref"))
         response = root_responses.get(type_name, {}).copy()
         
     # restisuisce risultato
@@ -147,42 +278,12 @@ def resolve_ref_parameters(parameter, root_parameters):
 
     # se è un $ref esegue
     if "$ref" in parameter:    
-        type_name = parameter.get("$ref").split("/")[-1]
+        type_name = ref_type_name(parameter.get("$ref"))
         parameter = root_parameters.get(type_name, {}).copy()
         
     # restisuisce risultato
     return parameter
       
-# ####################################################################################################
-# Risolve ricorsivamente gli $ref, evitando loop infiniti e unendo le proprietà
-# ####################################################################################################       
-def resolve_ref(schema, root_schemas, seen=None):
-
-    # se è un $ref esegue
-    if "$ref" in schema:
-    
-        # determina il tipo referenziato
-        type_name = schema.get("$ref").split("/")[-1]
-        
-        # se il controllo dei loop non è inizializzato provvede, altrimenti se il tipo è già stato visitato esce per evitare i loop
-        if seen is None:
-            seen = set()           
-        elif type_name in seen:
-            return {}  
-            
-        # aggiunge il tipo al controllo dei loop
-        seen.add(type_name)
-
-        # determina ricorsivamente il primo schema della catena nidificata di $ref
-        resolved = root_schemas.get(type_name, {}).copy()        
-        nested = resolve_ref(resolved, root_schemas, seen)
-        
-        # restituisce 
-        return {**nested, **schema}  # priorità a schema locale
-
-    # restisuisce immodificato lo schema in ingresso
-    return schema
-
 # ####################################################################################################
 # Acquisce le restrizioni dalle proprietà dal swagger/openapi
 # ####################################################################################################
@@ -191,67 +292,50 @@ def get_restrictions(schema):
     type_name = schema.get("type")
     
     if (type_name in ["number","integer"]):
-        return {
-            k: schema[k]
-            for k in ["minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"] if k in schema
-        }
-    
+        restriction_keys = NUMERIC_RESTRICTION_KEYS
     elif (type_name=="string"):
-        return {
-            k: schema[k]
-            for k in ["minLength", "maxLength", "pattern", "enum"] if k in schema
-        }    
-        
+        restriction_keys = STRING_RESTRICTION_KEYS
     else:
         return {}        
+
+    # intersezione delle chiavi (vuota nel caso più comune di proprietà senza restrizioni)
+    return {k: schema[k] for k in schema.keys() & restriction_keys}
     
 # ####################################################################################################
 # Esegue mapping delle restrizioni da swagger/openapi a XSD
 # ####################################################################################################
 def map_restrictions(element, schema):
 
-    if "pattern" in schema:
-        ET.SubElement(element, f"{{{XSD_NAMESPACE}}}pattern", value=schema["pattern"])
-        
-    if "minLength" in schema:
-        ET.SubElement(element, f"{{{XSD_NAMESPACE}}}minLength", value=str(schema["minLength"]))
-        
-    if "maxLength" in schema:
-        ET.SubElement(element, f"{{{XSD_NAMESPACE}}}maxLength", value=str(schema["maxLength"]))
-        
-    if "minimum" in schema:
-        if schema.get("exclusiveMinimum",False):
-            ET.SubElement(element, f"{{{XSD_NAMESPACE}}}minExclusive", value=str(schema["minimum"]))
-        else:
-            ET.SubElement(element, f"{{{XSD_NAMESPACE}}}minInclusive", value=str(schema["minimum"]))
+    # se non ci sono restrizioni esce
+    if not schema:
+        return
 
-    if "maximum" in schema:
-        if schema.get("exclusiveMaximum",False):
-            ET.SubElement(element, f"{{{XSD_NAMESPACE}}}maxExclusive", value=str(schema["maximum"]))
-        else:
-            ET.SubElement(element, f"{{{XSD_NAMESPACE}}}maxInclusive", value=str(schema["maximum"]))
+    # mappa le restrizioni tramite la tabella (scegliendo il facet esclusivo se il relativo flag è impostato)
+    for restriction_name, facet_name, exclusive_name, exclusive_facet_name in RESTRICTION_TAGS:
+        if restriction_name in schema:
+            if exclusive_name and schema.get(exclusive_name,False):
+                facet_name = exclusive_facet_name
+            ET.SubElement(element, facet_name, {"value": str(schema[restriction_name])})
             
     if "enum" in schema:
         for value in schema.get("enum"):
-           ET.SubElement(element, f"{{{XSD_NAMESPACE}}}enumeration", value=str(value if value!=None else ""))            
+           ET.SubElement(element, XSD_ENUMERATION, {"value": str(value if value!=None else "")})            
 
 # ####################################################################################################
 # Gestisce mapping della nullability dei tipi atomici
 # ####################################################################################################
-def map_nullability(schema, type_prefix, type_name, nullability_registry, restriction_registry):
+def map_nullability(type_nullable, type_prefix, type_name, nullability_registry):
    
-    if (not schema.get("nullable",False)) or (NULL_MODE=="nillable"):
+    if (not type_nullable) or (NULL_MODE=="nillable"):
         return f"{type_prefix}:{type_name}"
     else:        
         nillable_type = f"{type_name}Nillable"
     
         if not nillable_type in nullability_registry:
-           simple_type = ET.Element(f"{{{XSD_NAMESPACE}}}simpleType", name=nillable_type)
-           union = ET.SubElement(simple_type, f"{{{XSD_NAMESPACE}}}union", memberTypes=f"{type_prefix}:{type_name} {TARGET_PREFIX}:emptyString")
+           simple_type = ET.Element(XSD_SIMPLE_TYPE, name=nillable_type)
+           union = ET.SubElement(simple_type, XSD_UNION, memberTypes=f"{type_prefix}:{type_name} {TARGET_PREFIX}:emptyString")
            nullability_registry[nillable_type] = simple_type
 
-        schema.pop("nullable")
-        
         return f"{TARGET_PREFIX}:{nillable_type}"
 
 # ####################################################################################################
@@ -259,45 +343,109 @@ def map_nullability(schema, type_prefix, type_name, nullability_registry, restri
 # ####################################################################################################
 def map_type_atomic(schema):
         
-    # acquisisce gli attributi del tipo
-    type_prefix = XSD_PREFIX
     type_name = schema.get("type","")
     type_format = schema.get("format","")
-        
-    # gestisce tipi boolean
-    if type_name == "boolean":
-        return f"{type_prefix}:{type_name}"
-                                    
-    # gestisce tipi byte
-    if type_name == "string" and type_format == "byte":
-        return type_prefix+":base64Binary"
-
-    # gestisce fomati data stringa
-    if type_name == "string" and type_format in ["date", "date-time"]:
-        return type_prefix+":"+("dateTime" if type_format == "date-time" else "date")
 
-    # gestisce tipi stringa
-    if type_name == "string":
-        return f"{type_prefix}:{type_name}"
+    # determina il tipo atomico (memoizzato per coppia tipo/formato, che va verificata prima perché la cache richiede valori hashable)
+    mapped_type = map_type_atomic_name(type_name, type_format) if is_atomic_type_key(type_name, type_format) else None
 
-    # gestisce tipi numerici
-    if (((type_name == "number") and (type_format in ["","float","double"])) or
-        ((type_name == "integer") and (type_format in ["","int32","int64"]))):  
-    
-        # corregge tipo in base all'eventuale specificatore di formato
-        if (type_name=="number"):
-            type_name = "decimal" if type_format == "" else type_format
-        else:        
-            type_name = "integer" if type_format == "" else "int" if type_format == "int32" else "long"  
-        
-        return f"{type_prefix}:{type_name}"
+    if mapped_type:
+        return mapped_type
             
     # genera eccezione    
     print("Unsupported type: ",schema)
     sys.exit()
 
 # ####################################################################################################
-# Esegue mapping dei tipi swagger/openapi a XSD (crea tipi riusabili in presenza di retrizioni)
+# Verifica se tipo e formato swagger/openapi sono utilizzabili come chiave della tabella dei tipi atomici
+# ####################################################################################################
+def is_atomic_type_key(type_name, type_format):
+
+    # tipo e formato non stringa (es. "type": ["string","null"] di OpenAPI 3.1) non sono supportati
+    return isinstance(type_name, str) and isinstance(type_format, (str, type(None)))
+
+# ####################################################################################################
+# Cerca il tipo atomico XSD di una coppia tipo/formato swagger/openapi (None se non supportata)
+# ####################################################################################################
+def lookup_atomic_type(type_name, type_format):
+
+    if not is_atomic_type_key(type_name, type_format):
+        return None
+
+    # cerca la coppia esatta tipo/formato, altrimenti l'eventuale mapping valido per qualsiasi formato
+    return ATOMIC_TYPES.get((type_name, type_format)) or ATOMIC_TYPES.get((type_name, None))
+
+# ####################################################################################################
+# Determina il tipo atomico XSD qualificato di una coppia tipo/formato swagger/openapi (None se non supportata)
+# ####################################################################################################
+@functools.lru_cache(maxsize=None)
+def map_type_atomic_name(type_name, type_format):
+
+    atomic_name = lookup_atomic_type(type_name, type_format)
+    
+    # tipo non supportato
+    if not atomic_name:
+        return None
+
+    return f"{XSD_PREFIX}:{atomic_name}"
+
+# ####################################################################################################
+# Determina il nome del tipo stringa riusabile in base alle lunghezze (typed per non confondere 1, 1.0 e True)
+# ####################################################################################################
+@functools.lru_cache(maxsize=None, typed=True)
+def map_string_type_name(min_len, max_len):
+
+    pre_part = "emptyString" if max_len==0 else "openString" if not isinstance(max_len, int) else "string"       
+    min_part = f"{min_len}" if isinstance(min_len, int) and min_len>1 else ""
+    max_part = f"{max_len}" if isinstance(max_len, int) and max_len>0 else ""
+    sep_part = "to" if min_part!="" and max_part!="" else ""  
+    end_part = "Nillable" if min_len==0 else ""        
+
+    return f"{pre_part}{min_part}{sep_part}{max_part}{end_part}"
+
+# ####################################################################################################
+# Determina il nome del tipo numerico riusabile in base ai limiti (typed per non confondere 1, 1.0 e True)
+# ####################################################################################################
+@functools.lru_cache(maxsize=None, typed=True)
+def map_numeric_type_name(type_name, min_val, min_excl, max_val, max_excl):
+
+    # costruisce suffisso dai limiti
+    min_part = ("Gt"+("" if min_excl else "e")+f"{min_val}") if isinstance(min_val, int) else ""
+    max_part = ("Lt"+("" if max_excl else "e")+f"{max_val}") if isinstance(max_val, int) else ""          
+    end_part = min_part+max_part          
+    
+    # ridenomina alcuni tipi
+    if end_part == "Gt0":
+        return "positive"+type_name.capitalize()
+    elif end_part == "Gte0":
+        return "nonNegative"+type_name.capitalize()
+    elif end_part == "Lt0":
+        return "negative"+type_name.capitalize()
+    elif end_part == "Lte0":
+        return "nonPositive"+type_name.capitalize()
+    else:
+        return type_name+end_part
+
+# ####################################################################################################
+# Genera il simple type di un tipo riusabile (restriction del tipo atomico con i relativi facet)
+# ####################################################################################################
+def generate_restriction_type(type_name, atomic_name, restrictions):
+
+    simple_type = ET.Element(XSD_SIMPLE_TYPE, name=type_name)
+    restriction = ET.SubElement(simple_type, XSD_RESTRICTION, base=f"{XSD_PREFIX}:{atomic_name}")
+    map_restrictions(restriction, restrictions)
+    
+    return simple_type
+
+# ####################################################################################################
+# Filtra le restrizioni non gestite dal tipo mappato (da rendere nell'elemento)
+# ####################################################################################################
+def unmapped_restrictions(restrictions, mapped_keys):
+
+    return {k: v for k, v in restrictions.items() if not k in mapped_keys}
+
+# ####################################################################################################
+# Esegue mapping dei tipi swagger/openapi a XSD (crea tipi riusabili in presenza di retrizioni e restituisce anche le chiavi dello schema gestite dal tipo e le restrizioni non gestite)
 # ####################################################################################################
 def map_type(schema, nullability_registry, restriction_registry):
         
@@ -307,58 +455,43 @@ def map_type(schema, nullability_registry, restriction_registry):
     type_format = schema.get("format","")
     type_nullable = schema.get("nullable",False)
     type_restrictions = get_restrictions(schema)
-        
-    # gestisce tipi boolean
-    if type_name == "boolean":
-        return map_nullability(schema,type_prefix,type_name,nullability_registry,restriction_registry)
-                                    
-    # gestisce tipi byte
-    if type_name == "string" and type_format == "byte":
-        return map_nullability(schema,type_prefix,"base64Binary",nullability_registry,restriction_registry)
-
-    # gestisce fomati data stringa
-    if type_name == "string" and type_format in ["date", "date-time"]:
-        return map_nullability(schema,type_prefix,"dateTime" if type_format == "date-time" else "date",nullability_registry,restriction_registry)
+    
+    # chiavi dello schema gestite dal tipo mappato (la nullability è gestita dal tipo union se non si usa nillable)
+    mapped_keys = NULLABLE_KEYS if type_nullable and NULL_MODE!="nillable" else NO_KEYS
+    
+    # determina il tipo atomico tramite la tabella dei mapping
+    atomic_name = lookup_atomic_type(type_name, type_format)
 
+    # genera eccezione se il tipo non è supportato
+    if not atomic_name:
+        print("Unsupported type: ",schema)
+        sys.exit()
+        
     # gestisce tipi stringa
-    if type_name == "string":
+    if atomic_name == "string":
     
         # acquisisce eventuali restrizioni sui limiti
         min_len = type_restrictions.get("minLength", 0)
         max_len = type_restrictions.get("maxLength", "")
 
         # costruisce nome tipo riusabile
-        pre_part = "emptyString" if max_len==0 else "openString" if not isinstance(max_len, int) else "string"       
-        min_part = f"{min_len}" if isinstance(min_len, int) and min_len>1 else ""
-        max_part = f"{max_len}" if isinstance(max_len, int) and max_len>0 else ""
-        sep_part = "to" if min_part!="" and max_part!="" else ""  
-        end_part = "Nillable" if min_len==0 else ""        
-        type_name = pre_part+min_part+sep_part+max_part+end_part
+        type_name = map_string_type_name(min_len, max_len)
                         
         # se non è già definito predispone simple type XML del tipo riusabile
         if not type_name in restriction_registry:
-            simple_type = ET.Element(f"{{{XSD_NAMESPACE}}}simpleType", name=type_name)
-            restriction = ET.SubElement(simple_type, f"{{{XSD_NAMESPACE}}}restriction", base=f"{XSD_PREFIX}:string")
-            map_restrictions(restriction, dict(filter(lambda item: item[0] in {"minLength","maxLength"}, type_restrictions.items())))        
-            restriction_registry[type_name] = simple_type        
-
-        # rimuove dallo schema le restrizioni mappate sul tipo riusabile (che non è necessario rigestire nel rendering dell'elemento)
-        schema.pop("minLength",None)
-        schema.pop("maxLength",None)
+            restriction_registry[type_name] = generate_restriction_type(type_name, atomic_name, {k: type_restrictions[k] for k in type_restrictions.keys() & STRING_LENGTH_KEYS})
 
-        return f"{TARGET_PREFIX}:{type_name}"
+        # le restrizioni sulle lunghezze sono gestite dal tipo riusabile (non è necessario rigestirle nel rendering dell'elemento)
+        return f"{TARGET_PREFIX}:{type_name}", STRING_LENGTH_KEYS, unmapped_restrictions(type_restrictions, STRING_LENGTH_KEYS)
 
     # gestisce tipi numerici
-    if (((type_name == "number") and (type_format in ["","float","double"])) or
-        ((type_name == "integer") and (type_format in ["","int32","int64"]))):  
+    if type_name in ["number","integer"]:
     
-        # corregge tipo in base all'eventuale specificatore di formato
-        if (type_name=="number"):
-            type_name = "decimal" if type_format == "" else type_format
-        else:        
-            type_name = "integer" if type_format == "" else "int" if type_format == "int32" else "long"  
+        # usa il tipo corrispondente all'eventuale specificatore di formato
+        type_name = atomic_name
         
-        # acquisisce eventuali restrizioni sui limiti
+        # acquisisce eventuali restrizioni sui limiti (le restrizioni dello schema restano invariate per il rendering dell'elemento)
+        bound_restrictions = dict(type_restrictions)
         min_val = type_restrictions.get("minimum","")
         max_val = type_restrictions.get("maximum","")
         min_excl = type_restrictions.get("exclusiveMinimum",False)
@@ -373,8 +506,8 @@ def map_type(schema, nullability_registry, restriction_registry):
               ((max_val == 9223372036854775807) and (max_excl==False))))):
              
             max_val = ""
-            type_restrictions.pop("maximum",None)
-            type_restrictions.pop("exclusiveMaximum",None)
+            bound_restrictions.pop("maximum",None)
+            bound_restrictions.pop("exclusiveMaximum",None)
                                           
         # se ci sono restrizioni sui limiti introduce tipo riusabile
         if (min_val!="") or (max_val!=""):
@@ -384,40 +517,19 @@ def map_type(schema, nullability_registry, restriction_registry):
             atomic_name = type_name
         
             # costruisce nome tipo riusabile
-            min_part = ("Gt"+("" if min_excl else "e")+f"{min_val}") if isinstance(min_val, int) else ""
-            max_part = ("Lt"+("" if max_excl else "e")+f"{max_val}") if isinstance(max_val, int) else ""          
-            end_part = min_part+max_part          
-            
-            # ridenomina alcuni tipi
-            if end_part == "Gt0":
-                type_name = "positive"+type_name.capitalize()
-            elif end_part == "Gte0":
-                type_name = "nonNegative"+type_name.capitalize()
-            elif end_part == "Lt0":
-                type_name = "negative"+type_name.capitalize()
-            elif end_part == "Lte0":
-                type_name = "nonPositive"+type_name.capitalize()
-            else:
-                type_name = type_name+end_part
+            type_name = map_numeric_type_name(atomic_name, min_val, min_excl, max_val, max_excl)
                 
             # se non è già definito predispone simple type XML del tipo riusabile
             if not type_name in restriction_registry:            
-                simple_type = ET.Element(f"{{{XSD_NAMESPACE}}}simpleType", name=type_name)
-                restriction = ET.SubElement(simple_type, f"{{{XSD_NAMESPACE}}}restriction", base=f"{XSD_PREFIX}:{atomic_name}")
-                map_restrictions(restriction, dict(filter(lambda item: item[0] in {"minimum","maximum","exclusiveMinimum","exclusiveMaximum"}, type_restrictions.items())))            
-                restriction_registry[type_name] = simple_type
+                restriction_registry[type_name] = generate_restriction_type(type_name, atomic_name, bound_restrictions)
                        
-            # rimuove dallo schema le restrizioni mappate sul tipo riusabile (che non è necessario rigestire nel rendering dell'elemento)
-            schema.pop("minimum",None)
-            schema.pop("maximum",None)
-            schema.pop("exclusiveMinimum",None)
-            schema.pop("exclusiveMaximum",None)
+            # le restrizioni sui limiti sono gestite dal tipo riusabile (non è necessario rigestirle nel rendering dell'elemento)
+            mapped_keys = mapped_keys | NUMERIC_RESTRICTION_KEYS
 
-        return map_nullability(schema,type_prefix,type_name,nullability_registry,restriction_registry)
+        return map_nullability(type_nullable,type_prefix,type_name,nullability_registry), mapped_keys, unmapped_restrictions(type_restrictions, mapped_keys)
             
-    # genera eccezione    
-    print("Unsupported type: ",schema)
-    sys.exit()
+    # gestisce gli altri tipi atomici (boolean, byte, date, date-time)
+    return map_nullability(type_nullable,type_prefix,atomic_name,nullability_registry), mapped_keys, unmapped_restrictions(type_restrictions, mapped_keys)
     
 # ####################################################################################################
 # Genera Element/SimpleType
@@ -426,20 +538,18 @@ def generate_xsd_simple_type(level, parent_element, schema, nullability_registry
 
     # se si tratta di un ref lo gestisce ad hoc
     if "$ref" in schema:
-        ref_name = schema["$ref"].split("/")[-1]
-        parent_element.set('type',f"{TARGET_PREFIX}:{ref_name}")
+        parent_element.set('type',ref_qualified_name(schema["$ref"]))
         return
 
-    # se necessario aggiunge attributo di nullability
-    if schema.get("nullable", False) and NULL_MODE!="union":
-       parent_element.set('nillable',"true")    
+    # verifica se è necessario l'attributo di nullability
+    schema_nullable = schema.get("nullable", False)
+    type_nillable = schema_nullable and NULL_MODE!="union"
             
-    # determina il tipo xsd più appropriato 
-    mapped_type = map_type(schema,nullability_registry,restriction_registry)
+    # determina il tipo xsd più appropriato (con le chiavi dello schema già gestite dal tipo mappato e le restrizioni rimanenti)
+    mapped_type, mapped_keys, type_restrictions = map_type(schema,nullability_registry,restriction_registry)
 
-    # riacquisisce parametri tipo 
-    type_nullable = schema.get("nullable", False) and NULL_MODE!="nillable"    
-    type_restrictions = get_restrictions(schema)
+    # riacquisisce la nullability se non gestita dal tipo mappato
+    type_nullable = schema_nullable and NULL_MODE!="nillable" and not "nullable" in mapped_keys
     
     # crea il nodo xml appropriato al tipo dell'elemento
     if not type_restrictions:
@@ -447,30 +557,31 @@ def generate_xsd_simple_type(level, parent_element, schema, nullability_registry
         if not type_nullable:
             parent_element.set('type',mapped_type)
         else:
-            simple_type = ET.SubElement(parent_element, f"{{{XSD_NAMESPACE}}}simpleType")
-            union = ET.SubElement(simple_type, f"{{{XSD_NAMESPACE}}}union", memberTypes=f"{mapped_type} {TARGET_PREFIX}:emptyString")    
+            simple_type = ET.SubElement(parent_element, XSD_SIMPLE_TYPE)
+            union = ET.SubElement(simple_type, XSD_UNION, memberTypes=f"{mapped_type} {TARGET_PREFIX}:emptyString")    
     
     elif not type_nullable:
-        simple_type = ET.SubElement(parent_element, f"{{{XSD_NAMESPACE}}}simpleType")
-        restriction = ET.SubElement(simple_type, f"{{{XSD_NAMESPACE}}}restriction", base=mapped_type)
+        simple_type = ET.SubElement(parent_element, XSD_SIMPLE_TYPE)
+        restriction = ET.SubElement(simple_type, XSD_RESTRICTION, base=mapped_type)
         map_restrictions(restriction, type_restrictions)
     else:
-        simple_type = ET.SubElement(parent_element, f"{{{XSD_NAMESPACE}}}simpleType")
-        union = ET.SubElement(simple_type, f"{{{XSD_NAMESPACE}}}union", memberTypes=f"{TARGET_PREFIX}:emptyString")            
-        inline = ET.SubElement(union, f"{{{XSD_NAMESPACE}}}simpleType")
-        restriction = ET.SubElement(inline, f"{{{XSD_NAMESPACE}}}restriction", base=mapped_type)
+        simple_type = ET.SubElement(parent_element, XSD_SIMPLE_TYPE)
+        union = ET.SubElement(simple_type, XSD_UNION, memberTypes=f"{TARGET_PREFIX}:emptyString")            
+        inline = ET.SubElement(union, XSD_SIMPLE_TYPE)
+        restriction = ET.SubElement(inline, XSD_RESTRICTION, base=mapped_type)
         map_restrictions(restriction, type_restrictions)
 
+    # se necessario aggiunge attributo di nullability (in coda al type)
+    if type_nillable:
+       parent_element.set('nillable',"true")    
+
 # ####################################################################################################
 # Genera ComplexType
 # ####################################################################################################
-def generate_xsd_type(level, parent_element, root_name, def_body, root_schemas, nullability_registry, restriction_registry):
+def generate_xsd_type(level, parent_element, root_name, def_body, nullability_registry, restriction_registry):
 
-    # verifica se si tratta di un $ref
+    # verifica se si tratta di un $ref (gestito come riferimento al tipo, senza risolverlo)
     def_ref = def_body.get("$ref","");                    
-                    
-    # risolve eventuali $ref sullo schema body
-    def_body = resolve_ref(def_body, root_schemas)      
 
     #  determina il tipo dello schema
     def_type = def_body.get("type", "object");    
@@ -485,77 +596,53 @@ def generate_xsd_type(level, parent_element, root_name, def_body, root_schemas,
         # crea nodi per array
         if ARRAY_MODE=="inline":
             array_element = parent_element
-            array_element.set("minOccurs",min_len)
-            array_element.set("maxOccurs",max_len)
         else:
-            array_type = ET.SubElement(parent_element,f"{{{XSD_NAMESPACE}}}complexType")             
-            array_sequence = ET.SubElement(array_type, f"{{{XSD_NAMESPACE}}}sequence")
-            array_element = ET.SubElement(array_sequence, f"{{{XSD_NAMESPACE}}}element", attrib={
-                "name": "item", "minOccurs": f"{min_len}", "maxOccurs": f"{max_len}"
-            })
+            array_type = ET.SubElement(parent_element,XSD_COMPLEX_TYPE)             
+            array_sequence = ET.SubElement(array_type, XSD_SEQUENCE)
+            array_element = ET.SubElement(array_sequence, XSD_ELEMENT, name="item")
         
         # se è un nodo radice aggiunge l'attributo del nome
         if (root_name!=""):
            array_type.set("name",root_name)
         
         # genera definizione del tipo in modo ricorsivo
-        generate_xsd_type(level+1,array_element,"",def_body.get("items", {}),root_schemas,nullability_registry,restriction_registry)               
+        generate_xsd_type(level+1,array_element,"",def_body.get("items", {}),nullability_registry,restriction_registry)               
+
+        # aggiunge in coda i limiti dell'array (se non già impostati da un array nidificato)
+        if not "minOccurs" in array_element.attrib:
+            array_element.set("minOccurs",f"{min_len}")
+            array_element.set("maxOccurs",f"{max_len}")
     
     # se si tratta di un object esegue
     elif def_ref=="" and def_type == "object":
                          
         # determina attributi accessori dell'object    
-        def_required = def_body.get("required", [])
-        def_properties = def_body.get("properties", {})
-
-        # determina padding per i type degli elementi
-        name_padding = max([len(p) for p, a in def_properties.items() if a.get("type") != "array" or ARRAY_MODE=="inline"] or [0])
-           
-        # crea nodi per complex type
-        complex_type = ET.SubElement(parent_element,f"{{{XSD_NAMESPACE}}}complexType")             
-        sequence = ET.SubElement(complex_type, f"{{{XSD_NAMESPACE}}}sequence")
+        def_required = frozenset(def_body.get("required", ()))
+        def_properties = def_body.get("properties", EMPTY_DICT)
 
-        # se è un nodo radice aggiunge l'attributo del nome
-        if (root_name!=""):
-           complex_type.set("name",root_name)
+        # crea nodi per complex type (se è un nodo radice con l'attributo del nome)
+        complex_type = ET.SubElement(parent_element,XSD_COMPLEX_TYPE, {"name": root_name} if root_name else {})             
+        sequence = ET.SubElement(complex_type, XSD_SEQUENCE)
 
         # esegue un ciclo su tutte le proprietà del complex type
         for prop_name, prop_attrs in def_properties.items():
                         
-            # crea attributi per nodo 
-            element_attrib = {"name": prop_name}
-            
-            # verifica e gestisce se l'elemento non è obbligatorio
-            if prop_name not in def_required:
-                element_attrib["minOccurs"] = "0"
-
             # acquisisce attributi proprietà
             prop_ref = prop_attrs.get("$ref",""); 
             prop_type = prop_attrs.get("type"); 
                 
+            # crea nodo per elemento (gli attributi di occorrenza sono aggiunti in coda dopo la definizione del tipo)
+            element = ET.SubElement(sequence,XSD_ELEMENT, {"name": prop_name})
+
             # se non si tratta $ref ed è un tipo array o object esegue, altrimenti procede
             if prop_ref=="" and prop_type in ["array","object"]:
-            
-                # se necessario corregge nome elemento per introdurre padding
-                if prop_type=="array" and ARRAY_MODE=="inline":
-                    element_attrib["name"] = element_attrib["name"] + (" " * (name_padding-len(prop_name)))
-                                                    
-                # crea nodo per elemento di tipo array
-                complex_element = ET.SubElement(sequence,f"{{{XSD_NAMESPACE}}}element", attrib=element_attrib)
-                
-                # genera definizione del tipo
-                generate_xsd_type(level+1,complex_element,"",prop_attrs,root_schemas,nullability_registry,restriction_registry)
-                
+                generate_xsd_type(level+1,element,"",prop_attrs,nullability_registry,restriction_registry)
             else:
-            
-                # corregge nome elemento per introdurre padding
-                element_attrib["name"] = element_attrib["name"] + (" " * (name_padding-len(prop_name)))
-                    
-                # crea nodo per elemento semplice
-                simple_element = ET.SubElement(sequence,f"{{{XSD_NAMESPACE}}}element", attrib=element_attrib)
-                
-                # genera definizione del tipo
-                generate_xsd_simple_type(level,simple_element,prop_attrs,nullability_registry,restriction_registry)                                
+                generate_xsd_simple_type(level,element,prop_attrs,nullability_registry,restriction_registry)                                
+
+            # verifica e gestisce se l'elemento non è obbligatorio (salvo limiti già impostati dall'array)
+            if prop_name not in def_required and not "minOccurs" in element.attrib:
+                element.set("minOccurs","0")
 
     else:
 
@@ -567,32 +654,27 @@ def generate_xsd_type(level, parent_element, root_name, def_body, root_schemas,
 # ####################################################################################################
 def generate_xsd(root_schemas,element_registry,nullability_registry,restriction_registry):
 
-    # funzione di supporto per ordinamento dei simple type per le restriction
-    def sorting_criteria(restriction_element):
+    # funzione di supporto per ordinamento dei simple type per le restriction (accede direttamente ai facet, senza visitare il sottoalbero)
+    def sorting_criteria(simple_type):
     
-        min_len = None
-        max_len = None
-        type_order = None
+        restriction = simple_type.find(XSD_RESTRICTION)
+        min_len = restriction.find(XSD_MIN_LENGTH)
+        max_len = restriction.find(XSD_MAX_LENGTH)
         
-        for child in restriction_element.iter():
-            if child.tag.endswith("restriction"):
-                type_order = child.attrib.get("base")
-            if child.tag.endswith("minLength"):
-                min_len = int(child.attrib.get("value", "0"))
-            if child.tag.endswith("maxLength"):
-                max_len = int(child.attrib.get("value", str(float('inf'))))
+        min_len = int(min_len.get("value")) if min_len is not None else 0
+        max_len = int(max_len.get("value")) if max_len is not None else 0
                 
-        return (type_order, max_len or float('inf'), min_len or 0)
+        return (restriction.get("base"), max_len or sys.maxsize, min_len)
 
     # prepara variabili di lavoro
     complex_types = ET.Element("root")
     element_declarations = []
 
     # genera nodo radice dell'XSD
-    schema = ET.Element(f"{{{XSD_NAMESPACE}}}schema", attrib={
+    schema = ET.Element(XSD_SCHEMA, attrib={
+        f"xmlns:{TARGET_PREFIX}": TARGET_NAMESPACE,
         "targetNamespace": TARGET_NAMESPACE,
-        "elementFormDefault": "unqualified",
-        f"xmlns:{TARGET_PREFIX}": TARGET_NAMESPACE
+        "elementFormDefault": "unqualified"
     })
 
     # ================================================================================================
@@ -607,7 +689,7 @@ def generate_xsd(root_schemas,element_registry,nullability_registry,restriction_
             complex_types.append(ET.Comment(" ~~~~~~~~ "))
 
         # genera il prossimo complex type
-        generate_xsd_type(0,complex_types, def_name, def_body, root_schemas, nullability_registry, restriction_registry)
+        generate_xsd_type(0,complex_types, def_name, def_body, nullability_registry, restriction_registry)
                             
     # ================================================================================================
     # Genera Special Types
@@ -616,9 +698,9 @@ def generate_xsd(root_schemas,element_registry,nullability_registry,restriction_
     schema.append(ET.Comment(" SimpleTypes for nullability of atomic types"))
     schema.append(ET.Comment("#" * 100))
 
-    empty_string = ET.Element(f"{{{XSD_NAMESPACE}}}simpleType", name="emptyString")
-    restriction = ET.SubElement(empty_string, f"{{{XSD_NAMESPACE}}}restriction", base=f"{XSD_PREFIX}:string")
-    ET.SubElement(restriction, f"{{{XSD_NAMESPACE}}}length", value="0")
+    empty_string = ET.Element(XSD_SIMPLE_TYPE, name="emptyString")
+    restriction = ET.SubElement(empty_string, XSD_RESTRICTION, base=f"{XSD_PREFIX}:string")
+    ET.SubElement(restriction, XSD_LENGTH, value="0")
     schema.append(empty_string)
     
     for element in nullability_registry.values():    
@@ -632,14 +714,10 @@ def generate_xsd(root_schemas,element_registry,nullability_registry,restriction_
     schema.append(ET.Comment(" SimpleTypes for reusable restrictions"))
     schema.append(ET.Comment("#" * 100))
 
+    # calcola il criterio di ordinamento una sola volta per ciascun simple type
     sorted_simpletypes = sorted(
         restriction_registry.items(),
-        key=lambda item: (
-            sorting_criteria(item[1])[0], 
-            sorting_criteria(item[1])[1],
-            sorting_criteria(item[1])[2]
-            #item[0].lower()[0]
-        )
+        key=lambda item: sorting_criteria(item[1])
     )
     
     for idx, (type_name, restriction) in enumerate(sorted_simpletypes):
@@ -656,8 +734,7 @@ def generate_xsd(root_schemas,element_registry,nullability_registry,restriction_
     schema.append(ET.Comment(" ComplexTypes for schema definitions"))
     schema.append(ET.Comment("#" * 100))
 
-    for child in complex_types:
-       schema.append(child);
+    schema.extend(complex_types)
 
     # ================================================================================================
     # Genera Element di interfaccia
@@ -698,9 +775,12 @@ def derive_operation_id(path,method_name):
 # ####################################################################################################
 # Genera il file WADL
 # ####################################################################################################
-def generate_wadl(spec,version,root_responses,root_parameters,root_schemas,xsd_filename,element_registry,nullability_registry,restriction_registry):
+def generate_wadl(spec,version,root_responses,root_parameters,root_schemas,xsd_filename,element_registry,operation_registry,nullability_registry,restriction_registry):
     
-    application = ET.Element(f"{{{WADL_NAMESPACE}}}application", attrib={
+    # la versione è costante per tutta la generazione, la valuta una sola volta
+    is_openapi3 = version == "openapi3"
+
+    application = ET.Element(WADL_APPLICATION, attrib={
         f"xmlns:{XSD_PREFIX}": XSD_NAMESPACE,
         f"xmlns:{TARGET_PREFIX}": TARGET_NAMESPACE
     })
@@ -711,8 +791,8 @@ def generate_wadl(spec,version,root_responses,root_parameters,root_schemas,xsd_f
     application.append(ET.Comment("#" * 100))
     application.append(ET.Comment(" Grammars "))
     application.append(ET.Comment("#" * 100))    
-    gram = ET.SubElement(application,f"{{{WADL_NAMESPACE}}}grammars")
-    ET.SubElement(gram,f"{{{WADL_NAMESPACE}}}include", href=os.path.basename(xsd_filename))
+    gram = ET.SubElement(application,WADL_GRAMMARS)
+    ET.SubElement(gram,WADL_INCLUDE, href=os.path.basename(xsd_filename))
 
     # ================================================================================================
     # Genera Resources
@@ -720,7 +800,14 @@ def generate_wadl(spec,version,root_responses,root_parameters,root_schemas,xsd_f
     application.append(ET.Comment("#" * 100))
     application.append(ET.Comment(" Resources "))
     application.append(ET.Comment("#" * 100))
-    resources = ET.SubElement(application,f"{{{WADL_NAMESPACE}}}resources", base=spec.get("servers", [{}])[0].get("url", "/") if version == "openapi3" else "")
+
+    # determina il base path delle resources (solo openapi3 prevede i servers)
+    if is_openapi3:
+        servers = spec.get("servers")
+        resources_base = servers[0].get("url", "/") if servers else "/"
+    else:
+        resources_base = ""
+    resources = ET.SubElement(application,WADL_RESOURCES, base=resources_base)
 
     # ================================================================================================
     # Genera Resource
@@ -731,7 +818,8 @@ def generate_wadl(spec,version,root_responses,root_parameters,root_schemas,xsd_f
         if idx > 0:
            resources.append(ET.Comment(" ~~~~~~~~ "))
                 
-        resource = ET.SubElement(resources,f"{{{WADL_NAMESPACE}}}resource", path=path)
+        resource = ET.SubElement(resources,WADL_RESOURCE, path=path)
+        operation_registry[path] = []
 
         # ------------------------------------------------------------------------------------------------
         # Genera Method & Request
@@ -740,9 +828,8 @@ def generate_wadl(spec,version,root_responses,root_parameters,root_schemas,xsd_f
         for method_name, method_def in methods.items():
         
             # Acquisisce proprietà del metodo
-            produces = method_def.get("produces", []) 
-            responses = method_def.get("responses", {})
-            parameters = method_def.get("parameters", [])
+            responses = method_def.get("responses", EMPTY_DICT)
+            parameters = method_def.get("parameters", ())
             operationId = method_def.get("operationId", "").strip()
 
             # Se manca operationId lo ricava dal path estraendone l'ultimo token ignorando eventuali parametri
@@ -750,10 +837,12 @@ def generate_wadl(spec,version,root_responses,root_parameters,root_schemas,xsd_f
                 operationId = derive_operation_id(path,method_name)
 
             # Genera elemento XML del metodo
-            method = ET.SubElement(resource, f"{{{WADL_NAMESPACE}}}method", name=method_name.upper(), id=operationId, attrib={f"{{{SOA_NAMESPACE}}}wsdlOperation":operationId})
+            method = ET.SubElement(resource, WADL_METHOD, attrib={
+                SOA_WSDL_OPERATION: operationId, "name": method_name.upper(), "id": operationId
+            })
 
             # Genera elemento WADL della request del metodo
-            request_elem = ET.SubElement(method,f"{{{WADL_NAMESPACE}}}request")
+            request_elem = ET.SubElement(method,WADL_REQUEST)
                                                                                     
             # ------------------------------------------------------------------------------------------------
             # Genera Request Parameters
@@ -770,13 +859,11 @@ def generate_wadl(spec,version,root_responses,root_parameters,root_schemas,xsd_f
             
                 # Acquisisce attributi parametro
                 param_name = param.get("name")
-                param_style = param.get("in", "query")
+                param_style = PARAM_STYLES.get(param.get("in", "query"))
                 param_required = param.get("required", False)
                 
-                # Se necessario mappa style del parametro
-                if param_style == "path":
-                    param_style = "template"
-                elif not param_style in ["query", "header", "matrix"]:
+                # Se la posizione non è mappabile (es. body, formData) il parametro non è gestito
+                if not param_style:
                     continue
                 
                 # Acquisisce lo schema del parametro
@@ -789,23 +876,23 @@ def generate_wadl(spec,version,root_responses,root_parameters,root_schemas,xsd_f
                 if WADL_PARAM_MODE=="atomic":
                     param_type = map_type_atomic(schema)
                 else:                
-                    param_type = map_type(schema,nullability_registry,restriction_registry)
+                    param_type, _, _ = map_type(schema,nullability_registry,restriction_registry)
                 
                 # Aggiunge parametro all'elemento WADL                
-                ET.SubElement(request_elem,f"{{{WADL_NAMESPACE}}}param", name=param_name, style=param_style, type=param_type, required=str(param_required).lower(),attrib={
+                ET.SubElement(request_elem,WADL_PARAM, name=param_name, style=param_style, type=param_type, required="true" if param_required else "false",attrib={
                     f"{SOA_PREFIX}:expression": "$msg.parameters/"+param_name
                 })                     
                 
                 # Creazione elemento XSD dei parametri
                 if not parameters_node:                
                     parameters_name = operationId+"Parameters"
-                    parameters_node = ET.Element(f"{{{XSD_NAMESPACE}}}element", name=parameters_name)
-                    complex_type = ET.SubElement(parameters_node,f"{{{XSD_NAMESPACE}}}complexType")
-                    sequence = ET.SubElement(complex_type,f"{{{XSD_NAMESPACE}}}sequence")
+                    parameters_node = ET.Element(XSD_ELEMENT, name=parameters_name)
+                    complex_type = ET.SubElement(parameters_node,XSD_COMPLEX_TYPE)
+                    sequence = ET.SubElement(complex_type,XSD_SEQUENCE)
                     element_registry[parameters_name] = parameters_node         
 
                 # Aggiunge parametro ad elemento XSD dei parametri
-                param_elem = ET.SubElement(sequence,f"{{{XSD_NAMESPACE}}}element", name=param_name, type=param_type) 
+                param_elem = ET.SubElement(sequence,XSD_ELEMENT, name=param_name, type=param_type) 
                 
                 if not param_required:
                    param_elem.set("minOccurs","0");
@@ -816,65 +903,69 @@ def generate_wadl(spec,version,root_responses,root_parameters,root_schemas,xsd_f
                     
             # Prepara nomi per gli element di interfaccia
             request_name = operationId+"Request"
+            request_element = f"{TARGET_PREFIX}:{request_name}"
 
             # Prepara elemento XSD di request dell'operation
-            request_node = ET.Element(f"{{{XSD_NAMESPACE}}}element", name=request_name)
+            request_node = ET.Element(XSD_ELEMENT, name=request_name)
             element_registry[request_name] = request_node            
             sequence = None
             
             # Gestione dei representation di request body (swagger2)
-            if version == "swagger2":
+            if not is_openapi3:
                         
-                consumes = method_def.get("consumes", []) 
+                consumes = method_def.get("consumes", ()) 
 
                 for param in parameters:
                     if param.get("in")=="body":
                 
-                        schema_ref = param.get("schema", {}).get("$ref")
+                        schema_ref = param.get("schema", EMPTY_DICT).get("$ref")
                     
                         # Se non è uno schema $ref non lo gestisce e aggiunge solo elemento WADL, altrimenti procede
                         if not schema_ref:
-                            ET.SubElement(request_elem,f"{{{WADL_NAMESPACE}}}representation", mediaType=media_type)  
+                            ET.SubElement(request_elem,WADL_REPRESENTATION, mediaType=media_type)  
                         else:
-                            type_name = schema_ref.split("/")[-1]      
+                            body_type = ref_qualified_name(schema_ref)
                             
                             for media_type in consumes:          
 
                                 # Aggiunge body all'elemento WADL                                            
-                                ET.SubElement(request_elem,f"{{{WADL_NAMESPACE}}}representation", mediaType=media_type, element=f"{TARGET_PREFIX}:{request_name}")
+                                ET.SubElement(request_elem,WADL_REPRESENTATION, mediaType=media_type, element=request_element)
                                 
                                 # Aggiunge body all'elemento XSD
                                 if not sequence:
-                                   request_node.set("type",f"{TARGET_PREFIX}:{type_name}")
+                                   request_node.set("type",body_type)
                                 else:
-                                   ET.SubElement(sequence,f"{{{XSD_NAMESPACE}}}element", name=request_name, type=f"{TARGET_PREFIX}:{type_name}")                    
+                                   ET.SubElement(sequence,XSD_ELEMENT, name=request_name, type=body_type)                    
                 
             # Gestione dei representation per i request body (openapi3)
-            if version == "openapi3":
+            else:
             
                 # Prepara elenco delle request 
-                contents = method_def.get("requestBody",{}).get("content", {})
+                contents = method_def.get("requestBody", EMPTY_DICT).get("content", EMPTY_DICT)
                 
                 # Scandisce le request previste
                 for media_type, body_def in contents.items():
                                 
-                    schema_ref = body_def.get("schema", {}).get("$ref")
+                    schema_ref = body_def.get("schema", EMPTY_DICT).get("$ref")
                     
                     # Se non è uno schema $ref non lo gestisce e aggiunge solo elemento WADL, altrimenti procede
                     if not schema_ref:
-                        ET.SubElement(request_elem,f"{{{WADL_NAMESPACE}}}representation", mediaType=media_type)  
+                        ET.SubElement(request_elem,WADL_REPRESENTATION, mediaType=media_type)  
                     else:
-                        type_name = schema_ref.split("/")[-1]
+                        body_type = ref_qualified_name(schema_ref)
 
                         # Aggiunge body all'elemento WADL                                                               
-                        ET.SubElement(request_elem,f"{{{WADL_NAMESPACE}}}representation", mediaType=media_type, element=f"{TARGET_PREFIX}:{request_name}")
+                        ET.SubElement(request_elem,WADL_REPRESENTATION, mediaType=media_type, element=request_element)
                         
                         # Aggiunge body all'elemento XSD
                         if not sequence:
-                           request_node.set("type",f"{TARGET_PREFIX}:{type_name}")
+                           request_node.set("type",body_type)
                         else:
-                           ET.SubElement(sequence,f"{{{XSD_NAMESPACE}}}element", name=request_name, type=f"{TARGET_PREFIX}:{type_name}")                    
+                           ET.SubElement(sequence,XSD_ELEMENT, name=request_name, type=body_type)                    
                                         
+            # Censisce l'operation (con l'indicazione della presenza di parametri) per la generazione del WSDL
+            operation_registry[path].append([operationId,operationId,parameters_node is not None])
+
             # ------------------------------------------------------------------------------------------------
             # Gestisce Responses
             # ------------------------------------------------------------------------------------------------
@@ -887,15 +978,16 @@ def generate_wadl(spec,version,root_responses,root_parameters,root_schemas,xsd_f
                    
                 # Prepara nomi per gli element di interfaccia
                 response_name = operationId+"Response"+("Status"+status if status!="200" else "")
+                response_element = f"{TARGET_PREFIX}:{response_name}"
                 
                 # Genera elemento WADL della response
-                response_elem = ET.SubElement(method,f"{{{WADL_NAMESPACE}}}response", status=status)
+                response_elem = ET.SubElement(method,WADL_RESPONSE, status=status)
                 
                 # Prepara elenco delle response in base alla specifica
-                contents = response.get("content", {}) if version == "openapi3" else {"application/json": response}
+                contents = response.get("content", EMPTY_DICT) if is_openapi3 else {"application/json": response}
                 
                 # Se la response non è definita crea una representation/element vuoti, altrimenti procede
-                if version == "openapi3" and contents=={}:
+                if is_openapi3 and not contents:
                                         
                     # Se è già stato aggiunto un elemento all'XSD genera eccezione
                     if response_name in element_registry:
@@ -903,23 +995,23 @@ def generate_wadl(spec,version,root_responses,root_parameters,root_schemas,xsd_f
                         sys.exit()
                         
                     # Aggiunge body all'elemento XSD
-                    element_registry[response_name] = ET.Element(f"{{{XSD_NAMESPACE}}}element", name=response_name)                           
+                    element_registry[response_name] = ET.Element(XSD_ELEMENT, name=response_name)                           
                     
                 else:
                     
                     # Scandisce le response previste
                     for media_type, content_def in contents.items():
                     
-                        schema_ref = content_def.get("schema", {}).get("$ref")
+                        schema_ref = content_def.get("schema", EMPTY_DICT).get("$ref")
                         
                         # Se non è uno schema $ref non lo gestisce e aggiunge solo elemento WADL, altrimenti procede
                         if not schema_ref:
-                            ET.SubElement(response_elem,f"{{{WADL_NAMESPACE}}}representation", mediaType=media_type)  
+                            ET.SubElement(response_elem,WADL_REPRESENTATION, mediaType=media_type)  
                         else:
-                            type_name = schema_ref.split("/")[-1]
+                            body_type = ref_qualified_name(schema_ref)
                             
                             # Aggiunge body all'elemento WADL                                                               
-                            ET.SubElement(response_elem,f"{{{WADL_NAMESPACE}}}representation", mediaType=media_type, element=f"{TARGET_PREFIX}:{response_name}")
+                            ET.SubElement(response_elem,WADL_REPRESENTATION, mediaType=media_type, element=response_element)
                             
                             # Se è già stato aggiunto un elemento all'XSD genera eccezione
                             if response_name in element_registry:
@@ -927,7 +1019,7 @@ def generate_wadl(spec,version,root_responses,root_parameters,root_schemas,xsd_f
                                 sys.exit()
                                 
                             # Aggiunge body all'elemento XSD
-                            element_registry[response_name] = ET.Element(f"{{{XSD_NAMESPACE}}}element", name=response_name, type=f"{TARGET_PREFIX}:{type_name}")                           
+                            element_registry[response_name] = ET.Element(XSD_ELEMENT, name=response_name, type=body_type)                           
 
     # ================================================================================================
 
@@ -936,7 +1028,7 @@ def generate_wadl(spec,version,root_responses,root_parameters,root_schemas,xsd_f
 # ####################################################################################################
 # Genera il file WSDL
 # ####################################################################################################
-def generate_wsdl(application, xsd_filename):
+def generate_wsdl(operation_registry, xsd_filename):
 
     # ================================================================================================
     # Variabili
@@ -952,10 +1044,10 @@ def generate_wsdl(application, xsd_filename):
     # ================================================================================================
     # Genera Wsdl 
     # ================================================================================================
-    wsdl = ET.Element(f"{{{WSDL_NAMESPACE}}}definitions", attrib={
+    wsdl = ET.Element(WSDL_DEFINITIONS, attrib={
+        f"xmlns:{TARGET_PREFIX}": TARGET_NAMESPACE,
         "name": f"{SERVICE_NAME}_{SERVICE_VERSION}",
-        "targetNamespace": TARGET_NAMESPACE,
-        f"xmlns:{TARGET_PREFIX}": TARGET_NAMESPACE
+        "targetNamespace": TARGET_NAMESPACE
     })
 
     # ================================================================================================
@@ -965,11 +1057,11 @@ def generate_wsdl(application, xsd_filename):
     wsdl.append(ET.Comment(" TYPES "))
     wsdl.append(ET.Comment("#" * 100))    
     
-    types = ET.SubElement(wsdl, f"{{{WSDL_NAMESPACE}}}types")
-    schema = ET.SubElement(types, f"{{{XSD_NAMESPACE}}}schema", attrib={
+    types = ET.SubElement(wsdl, WSDL_TYPES)
+    schema = ET.SubElement(types, XSD_SCHEMA, attrib={
         "targetNamespace": TARGET_NAMESPACE
     })
-    ET.SubElement(schema, f"{{{XSD_NAMESPACE}}}include", attrib={
+    ET.SubElement(schema, XSD_INCLUDE, attrib={
         "schemaLocation": os.path.basename(xsd_filename)
     })
 
@@ -980,38 +1072,27 @@ def generate_wsdl(application, xsd_filename):
     wsdl.append(ET.Comment(" MESSAGES "))
     wsdl.append(ET.Comment("#" * 100))    
 
-    for idx, resource in enumerate(application.findall(f".//{{{WADL_NAMESPACE}}}resource")):
+    for idx, path_operations in enumerate(operation_registry.values()):
     
         if idx > 0:
             wsdl.append(ET.Comment(" ~~~~~~~~ "))
 
-        path = resource.attrib.get("path", "")
-        for method in resource.findall(f"{{{WADL_NAMESPACE}}}method"):
+        # Scandisce le operation censite durante la generazione del WADL (senza riattraversarne l'albero)
+        for operation_name, operation_soa, operation_parameters in path_operations:
                 
-            # Prepara operation
-            operation_name = method.attrib.get("id") 
-            operation_soa = method.attrib.get(f"{{{SOA_NAMESPACE}}}wsdlOperation") 
-
-            # Se manca operation_name lo ricava dal path estraendone l'ultimo token ignorando eventuali parametri
-            if not operation_name:
-                operation_name = derive_operation_id(path,method.attrib.get("name"))            
-
-            # Determina i parametri della request
-            parameters = method.findall(f".//{{{WADL_NAMESPACE}}}param")      
-        
             # Messaggio di input (con eventuali parametri)
-            msg_in = ET.SubElement(wsdl, f"{{{WSDL_NAMESPACE}}}message", name=f"{operation_name}_InputMessage")
-            ET.SubElement(msg_in, f"{{{WSDL_NAMESPACE}}}part", name="request", element=f"{TARGET_PREFIX}:{operation_name}Request")   
+            msg_in = ET.SubElement(wsdl, WSDL_MESSAGE, name=f"{operation_name}_InputMessage")
+            ET.SubElement(msg_in, WSDL_PART, name="request", element=f"{TARGET_PREFIX}:{operation_name}Request")   
             
-            if len(parameters)>0:
-               ET.SubElement(msg_in, f"{{{WSDL_NAMESPACE}}}part", name="parameters", element=f"{TARGET_PREFIX}:{operation_name}Parameters")
+            if operation_parameters:
+               ET.SubElement(msg_in, WSDL_PART, name="parameters", element=f"{TARGET_PREFIX}:{operation_name}Parameters")
 
             # Messaggio di output
-            msg_out = ET.SubElement(wsdl, f"{{{WSDL_NAMESPACE}}}message", name=f"{operation_name}_OutputMessage")            
-            ET.SubElement(msg_out, f"{{{WSDL_NAMESPACE}}}part", name="response", element=f"{TARGET_PREFIX}:{operation_name}Response")
+            msg_out = ET.SubElement(wsdl, WSDL_MESSAGE, name=f"{operation_name}_OutputMessage")            
+            ET.SubElement(msg_out, WSDL_PART, name="response", element=f"{TARGET_PREFIX}:{operation_name}Response")
 
             # Salva informazioni su operations per portType/binding
-            operations.append([operation_name,operation_soa,len(parameters)>0])
+            operations.append([operation_name,operation_soa,operation_parameters])
 
     # ================================================================================================
     # Genera PortType
@@ -1019,16 +1100,16 @@ def generate_wsdl(application, xsd_filename):
     wsdl.append(ET.Comment("#" * 100))
     wsdl.append(ET.Comment(" PORT TYPES "))
     wsdl.append(ET.Comment("#" * 100))        
-    port_type = ET.SubElement(wsdl, f"{{{WSDL_NAMESPACE}}}portType", name=port_type_name)
+    port_type = ET.SubElement(wsdl, WSDL_PORT_TYPE, name=port_type_name)
     
     for idx, operation in enumerate(operations):
     
         if idx > 0:
             port_type.append(ET.Comment(" ~~~~~~~~ "))
 
-        op = ET.SubElement(port_type, f"{{{WSDL_NAMESPACE}}}operation", name=operation[1])
-        ET.SubElement(op, f"{{{WSDL_NAMESPACE}}}input", message=f"{TARGET_PREFIX}:{operation[0]}_InputMessage")
-        ET.SubElement(op, f"{{{WSDL_NAMESPACE}}}output", message=f"{TARGET_PREFIX}:{operation[0]}_OutputMessage")
+        op = ET.SubElement(port_type, WSDL_OPERATION, name=operation[1])
+        ET.SubElement(op, WSDL_INPUT, message=f"{TARGET_PREFIX}:{operation[0]}_InputMessage")
+        ET.SubElement(op, WSDL_OUTPUT, message=f"{TARGET_PREFIX}:{operation[0]}_OutputMessage")
 
     # =====================
     # Genera Binding
@@ -1037,29 +1118,29 @@ def generate_wsdl(application, xsd_filename):
     wsdl.append(ET.Comment(" BINDINGS "))
     wsdl.append(ET.Comment("#" * 100))    
 
-    binding = ET.SubElement(wsdl, f"{{{WSDL_NAMESPACE}}}binding", name=binding_name, type=f"{TARGET_PREFIX}:{port_type_name}")
-    ET.SubElement(binding, f"{{{SOAP_NAMESPACE}}}binding", style="document", transport="http://schemas.xmlsoap.org/soap/http")
+    binding = ET.SubElement(wsdl, WSDL_BINDING, name=binding_name, type=f"{TARGET_PREFIX}:{port_type_name}")
+    ET.SubElement(binding, SOAP_BINDING, style="document", transport="http://schemas.xmlsoap.org/soap/http")
 
     for idx, operation in enumerate(operations):
     
         if idx > 0:
             binding.append(ET.Comment(" ~~~~~~~~ "))
 
-        op = ET.SubElement(binding, f"{{{WSDL_NAMESPACE}}}operation", name=operation[1])
-        ET.SubElement(op, f"{{{SOAP_NAMESPACE}}}operation", soapAction=operation[1], style="document" if not operation[2] or WSDL_PARAM_MODE=="header" else "rpc")
+        op = ET.SubElement(binding, WSDL_OPERATION, name=operation[1])
+        ET.SubElement(op, SOAP_OPERATION, soapAction=operation[1], style="document" if not operation[2] or WSDL_PARAM_MODE=="header" else "rpc")
         
         # Gestisce input
-        input_elem = ET.SubElement(op, f"{{{WSDL_NAMESPACE}}}input");
+        input_elem = ET.SubElement(op, WSDL_INPUT);
         
         if not operation[2] or WSDL_PARAM_MODE=="body":
-           input_elem.append(ET.Element(f"{{{SOAP_NAMESPACE}}}body", use="literal"))
+           input_elem.append(ET.Element(SOAP_BODY, use="literal"))
         else:
-           input_elem.append(ET.Element(f"{{{SOAP_NAMESPACE}}}body", use="literal", parts="request"))
-           input_elem.append(ET.Element(f"{{{SOAP_NAMESPACE}}}header", use="literal", part="parameters", message=f"{TARGET_PREFIX}:{operation[0]}_InputMessage")) 
+           input_elem.append(ET.Element(SOAP_BODY, use="literal", parts="request"))
+           input_elem.append(ET.Element(SOAP_HEADER, use="literal", part="parameters", message=f"{TARGET_PREFIX}:{operation[0]}_InputMessage")) 
         
         # Gestisce input
-        ET.SubElement(op, f"{{{WSDL_NAMESPACE}}}output").append(
-            ET.Element(f"{{{SOAP_NAMESPACE}}}body", use="literal")
+        ET.SubElement(op, WSDL_OUTPUT).append(
+            ET.Element(SOAP_BODY, use="literal")
         )
 
     # =====================
@@ -1069,9 +1150,9 @@ def generate_wsdl(application, xsd_filename):
     wsdl.append(ET.Comment(" SERVICES "))
     wsdl.append(ET.Comment("#" * 100))    
     
-    service = ET.SubElement(wsdl, f"{{{WSDL_NAMESPACE}}}service", name=service_name)
-    port = ET.SubElement(service, f"{{{WSDL_NAMESPACE}}}port", name=port_name, binding=f"{TARGET_PREFIX}:{binding_name}")
-    ET.SubElement(port, f"{{{SOAP_NAMESPACE}}}address", location="http://localhost/service")
+    service = ET.SubElement(wsdl, WSDL_SERVICE, name=service_name)
+    port = ET.SubElement(service, WSDL_PORT, name=port_name, binding=f"{TARGET_PREFIX}:{binding_name}")
+    ET.SubElement(port, SOAP_ADDRESS, location="http://localhost/service")
 
     return wsdl
 
@@ -1104,7 +1185,7 @@ def batch_search_and_replace_templates(source_directory, replacements, output_ba
             content = regex.sub(replacement, content)
 
         filename, ext = os.path.splitext(filename)
-        filename = re.sub("%FILENAME%",output_basename,filename)
+        filename = filename.replace("%FILENAME%",output_basename)
         base_filename = f"{filename}{ext}"
         final_filename = base_filename
         
@@ -1231,8 +1312,7 @@ def main():
         OSB_PATH = os.path.basename(os.path.abspath(args.output_dir+"/.."))+"/"+os.path.basename(os.path.abspath(args.output_dir))
     
     # Carica il file json del descrittore di input
-    with open(args.descriptor_file, "r", encoding="utf-8") as f:
-        spec = json.load(f)
+    spec = load_json(args.descriptor_file)
 
     # Prepara i nomi dei file di output
     filename_base = os.path.splitext(os.path.basename(args.descriptor_file))[0] if args.file_base=="<input-file>" else args.file_base
@@ -1249,6 +1329,7 @@ def main():
     
     # Censisce i tipi utilizzati a vario titolo
     element_registry = {}
+    operation_registry = {}
     nullability_registry = {}
     restriction_registry = {}
 
@@ -1257,25 +1338,22 @@ def main():
     root_parameters = extract_root_parameters(spec, version)
     
     # Generazione del WADL
-    wadl_tree = generate_wadl(spec,version,root_responses,root_parameters,root_schemas,xsd_filename,element_registry,nullability_registry,restriction_registry)
+    wadl_tree = generate_wadl(spec,version,root_responses,root_parameters,root_schemas,xsd_filename,element_registry,operation_registry,nullability_registry,restriction_registry)
 
     # Generazione del WSDL
-    wsdl_tree = generate_wsdl(wadl_tree,xsd_filename)
+    wsdl_tree = generate_wsdl(operation_registry,xsd_filename)
     
     # Generazione XSD 
     xsd_tree = generate_xsd(root_schemas,element_registry,nullability_registry,restriction_registry)
 
     # Scrittura file XSD
-    with open(os.path.join(args.output_dir, xsd_filename), "w", encoding="utf-8") as f:
-        f.write(prettify_xml(xsd_tree))
+    write_xml(xsd_tree, os.path.join(args.output_dir, xsd_filename))
 
     # Scrittura file WADL
-    with open(os.path.join(args.output_dir, wadl_filename), "w", encoding="utf-8") as f:
-        f.write(prettify_xml(wadl_tree))
+    write_xml(wadl_tree, os.path.join(args.output_dir, wadl_filename))
 
     # Scrittura file WSDL
-    with open(os.path.join(args.output_dir, wsdl_filename), "w", encoding="utf-8") as f:
-        f.write(prettify_xml(wsdl_tree))
+    write_xml(wsdl_tree, os.path.join(args.output_dir, wsdl_filename))
 
     print(f"Generated XSD: {xsd_filename}")
     print(f"Generated WADL: {wadl_filename}")